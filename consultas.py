@@ -4,19 +4,20 @@ import logging
 from modelos import Mascota # Importación de la clase Mascota para manejar las mascotas registradas
 
 
-# La lista de mascotas es compartida ya que se definió de forma global en el módulo registro
-from registro import mascotas
+# El registro por sedes es compartido ya que se definió de forma global en el módulo registro
+from registro import sedes, recorrer_sedes, todas_las_mascotas, mostrar_mascotas
 
 
-# Función para mostrar todas las mascotas registradas
+# Función para mostrar todas las mascotas registradas en todas las sedes
 def listar_mascotas():
     print("\n--- Lista de Mascotas ---")
-    if not mascotas:
+    registradas = todas_las_mascotas() # Las sedes se recorren en paralelo y sus resultados se unen en una sola lista
+    if not registradas:
         print("No hay mascotas registradas.\n")
         logging.info("Listado solicitado con éxito. No hay mascotas registradas") # Registro del evento ocurrido
-        return
-    for i, mascota in enumerate(mascotas, 1): # "enumerate" es una función que permite recorrer una lista y obtener el índice y el valor de cada elemento
-        print(f"{i}. {mascota}")
+        return registradas
+    mostrar_mascotas(registradas)
+    return registradas
 
 
 # Función para mostrar el historial de consultas veterinarias de una mascota
@@ -25,19 +26,19 @@ def ver_historial_consultas():
     # Validación de posibles errores en la consulta del historial
     try:
         print("\n--- Historial de Consultas (0 para volver) ---")
-        if not mascotas:
+        if not any(sedes.values()):
             print("\nNo hay mascotas registradas.\n")
             logging.info("Listado solicitado con éxito. No hay consultas registradas.")
             return
 
-        listar_mascotas()
+        registradas = listar_mascotas()
         id_input = input("Seleccione el número (ID) de la mascota: ")
         if id_input == "0": return
         idmascota = int(id_input) - 1
-        if not (0 <= idmascota < len(mascotas)):
+        if not (0 <= idmascota < len(registradas)):
             raise IndexError("ID de mascota no válido.")
 
-        mascota = mascotas[idmascota]
+        mascota = registradas[idmascota][1]
         if not mascota.consultas:
             print("\nNo hay consultas registradas para esta mascota.\n")
             logging.info(f"No hay consultas para la mascota {mascota.nombre}")
@@ -53,4 +54,33 @@ def ver_historial_consultas():
         logging.warning(f"El índice seleccionado está fuera del rango: {ie}") # Registro del error
     except Exception as e: # Captura de errores imprevistos en tiempo de ejecución
         print("Ocurrió un error al ver el historial.")
-        logging.exception("Excepción general al ver historial.") # Registro de la excepción general
\ No newline at end of file
+        logging.exception("Excepción general al ver historial.") # Registro de la excepción general
+
+
+# Función para buscar mascotas por su nombre o el de su dueño en todas las sedes
+def buscar_mascotas():
+    try:
+        print("\n--- Buscar Mascotas (0 para volver) ---")
+        texto = input("Nombre de la mascota o del dueño: ").strip().lower()
+        if texto == "0": return
+        if not texto:
+            raise ValueError("Debe ingresar un texto para buscar.")
+
+        # Cada sede se filtra en paralelo y los resultados se unen conservando el orden de las sedes
+        resultados = recorrer_sedes(lambda sede, lista: [
+            (sede, mascota) for mascota in list(lista)
+            if texto in mascota.nombre.lower() or texto in mascota.dueno.nombre.lower()])
+        encontradas = [par for resultado in resultados for par in resultado]
+
+        if not encontradas:
+            print("\nNo se encontraron mascotas.\n")
+            logging.info(f"Búsqueda sin resultados para '{texto}'")
+            return
+        mostrar_mascotas(encontradas)
+        logging.info(f"Búsqueda de '{texto}' con {len(encontradas)} resultado(s)")
+    except ValueError as ve: # Captura de errores de valor
+        print(f"Error: {ve}")
+        logging.error(f"Error al buscar mascotas: {ve}") # Registro del error
+    except Exception as e: # Captura de errores imprevistos en tiempo de ejecución
+        print("Ocurrió un error al buscar mascotas.")
+        logging.exception("Excepción general al buscar mascotas.") # Registro de la excepción general
\ No newline at end of file
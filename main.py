@@ -1,8 +1,8 @@
 # Módulo central que coordina la ejecución del sistema
 
 import logging # Importación del módulo logging para manejar registros de eventos
-from registro import registrar_mascota, registrar_consulta, mascotas # Importación de funciones para registrar mascotas y consultas
-from consultas import listar_mascotas, ver_historial_consultas # Importación de funciones para listar mascotas y ver historial de consultas
+from registro import registrar_mascota, registrar_consulta, cambiar_sede, obtener_sede_actual, limpiar_sedes, sedes # Importación de funciones para registrar mascotas y consultas y para manejar las sedes
+from consultas import listar_mascotas, ver_historial_consultas, buscar_mascotas # Importación de funciones para listar, buscar mascotas y ver historial de consultas
 from persistencia import guardar_mascotas_csv, guardar_consultas_json, cargar_mascotas_csv, cargar_consultas_json # Importación de funciones para guardar y cargar datos en formatos CSV y JSON
 
 
@@ -18,13 +18,16 @@ def menu():
     logging.info("Inicio de la aplicación.") # Registro del inicio de la aplicación
     while True:
         print("\n--- Clínica Veterinaria Amigos Peludos ---")
+        print(f"Sede actual: {obtener_sede_actual()}")
         print("1. Registrar mascota")
         print("2. Agendar consulta")
         print("3. Listar mascotas")
         print("4. Ver historial de consultas de una mascota específica")
         print("5. Exportar datos (CSV/JSON)")
         print("6. Importar datos (CSV/JSON)")
-        print("7. Salir")
+        print("7. Buscar mascotas")
+        print("8. Cambiar de sede")
+        print("9. Salir")
         opcion = input("Seleccione una opción: ")
 
         # Validación de posibles errores en la entrada del menú
@@ -42,17 +45,21 @@ def menu():
                 guardar_consultas_json()
                 print("Datos exportados exitosamente.")
             elif opcion == "6":
-                if mascotas: # Verifica si hay mascotas registradas antes de importar
+                if any(sedes.values()): # Verifica si hay mascotas registradas en alguna sede antes de importar
                     confirmacion = input("¿Está seguro de que desea importar datos? Esto sobrescribirá los datos actuales (S/N): ").lower()
                     if confirmacion != 's':
                         print("Importación cancelada.")
                         logging.info("Importación de datos cancelada por el usuario.")
                         continue
-                    mascotas.clear() # Esto evita duplicados al cargar los archivos
+                    limpiar_sedes() # Esto evita duplicados al cargar los archivos
                 cargar_mascotas_csv()
                 cargar_consultas_json()
                 print("\n¡Datos importados exitosamente!")
             elif opcion == "7":
+                buscar_mascotas()
+            elif opcion == "8":
+                cambiar_sede()
+            elif opcion == "9":
                 print("¡Hasta luego!")
                 logging.info("Cierre de la aplicación.") # Registro del cierre de la aplicación
                 break
@@ -3,91 +3,174 @@
 import os # Importación del módulo os para manejar operaciones del sistema operativo y verificar la existencia de archivos
 import csv # Importación del módulo csv para manejar archivos CSV
 import json # Importación del módulo json para manejar archivos JSON
+import glob # Importación del módulo glob para encontrar los archivos de cada sede
 import logging # Importación del módulo logging para manejar registros de eventos
 from modelos import Dueno, Mascota, Consulta # Importación de las clases Dueno, Mascota y Consulta
-from registro import mascotas # Importación de la lista de mascotas desde el módulo registro
+from registro import (SEDE_PRINCIPAL, sedes, obtener_sede, nombre_sede_valido,
+                      sedes_mascotas_modificadas, sedes_consultas_modificadas) # Importación del registro de mascotas particionado por sede
 
-# Archivos donde se alamcenrán los datos de las mascotas y sus consultas
+# Archivos donde se alamcenrán los datos de las mascotas y sus consultas de la sede principal
 archivo_csv = 'mascotas_dueños.csv'
 archivo_json = 'consultas.json'
 
+# Prefijos de los archivos de las demás sedes, p. ej. "mascotas_dueños_norte.csv" y "consultas_norte.json"
+prefijo_csv = 'mascotas_dueños_'
+prefijo_json = 'consultas_'
 
-# Función para guardar las mascotas y dueños en un archivo CSV
+
+# Función que devuelve los archivos CSV y JSON de una sede
+def archivos_sede(sede):
+    if sede == SEDE_PRINCIPAL:
+        return archivo_csv, archivo_json
+    return f"{prefijo_csv}{sede}.csv", f"{prefijo_json}{sede}.json"
+
+
+# Función que busca en disco los archivos existentes de cada sede y devuelve un diccionario {sede: archivo}
+def sedes_en_disco(archivo_principal, prefijo, extension):
+    encontradas = {}
+    if os.path.exists(archivo_principal):
+        encontradas[SEDE_PRINCIPAL] = archivo_principal
+    for archivo in sorted(glob.glob(f"{prefijo}*{extension}")):
+        sede = archivo[len(prefijo):-len(extension)]
+        if not nombre_sede_valido(sede) or sede == SEDE_PRINCIPAL:
+            logging.warning(f"El archivo {archivo} no corresponde a una sede válida. Se omitirá.")
+            continue
+        encontradas[sede] = archivo
+    return encontradas
+
+
+# Función que devuelve las sedes cuyo archivo debe reescribirse: las modificadas y las que aún no tienen archivo
+def sedes_por_guardar(modificadas, indice_archivo):
+    return {sede: lista for sede, lista in sedes.items()
+            if lista and (sede in modificadas or not os.path.exists(archivos_sede(sede)[indice_archivo]))}
+
+
+# Función para guardar en CSV las mascotas y dueños de una sede
+def guardar_mascotas_sede(sede, lista):
+    archivo_sede = archivos_sede(sede)[0]
+    with open(archivo_sede, mode='w', newline='', encoding='utf-8') as archivo: # "with open" es una forma de abrir un archivo que asegura que se cierre correctamente después de su uso
+        writer = csv.writer(archivo)
+        writer.writerow(['nombre_mascota', 'especie', 'raza', 'edad',
+                         'nombre_dueno', 'telefono', 'direccion'])
+        for mascota in lista:
+            writer.writerow([mascota.nombre, mascota.especie, mascota.raza, mascota.edad,
+                             mascota.dueno.nombre, mascota.dueno.telefono, mascota.dueno.direccion])
+    logging.info(f"Sede {sede}: {len(lista)} mascota(s) guardada(s) en {archivo_sede}")
+
+
+# Función para guardar las mascotas y dueños de todas las sedes, cada una en su propio archivo CSV
 def guardar_mascotas_csv():
     try:
-        if not mascotas:
+        if not any(sedes.values()):
             logging.warning("No hay mascotas registradas para guardar en el archivo CSV.")
             return
-        with open(archivo_csv, mode='w', newline='', encoding='utf-8') as archivo: # "with open" es una forma de abrir un archivo que asegura que se cierre correctamente después de su uso
-            writer = csv.writer(archivo)
-            writer.writerow(['nombre_mascota', 'especie', 'raza', 'edad',
-                             'nombre_dueno', 'telefono', 'direccion'])
-            for mascota in mascotas:
-                writer.writerow([mascota.nombre, mascota.especie, mascota.raza, mascota.edad,
-                                 mascota.dueno.nombre, mascota.dueno.telefono, mascota.dueno.direccion])
+        pendientes = sedes_por_guardar(sedes_mascotas_modificadas, 0) # Solo se reescriben las sedes con cambios
+        if not pendientes:
+            logging.info("No hay cambios en las mascotas para guardar en CSV.")
+            return
+        for sede, lista in pendientes.items():
+            guardar_mascotas_sede(sede, lista)
+            sedes_mascotas_modificadas.discard(sede)
         logging.info("Datos de mascotas y dueños guardados en CSV exitosamente")
     except Exception as e:
         logging.exception("Error al guardar datos de mascotas y dueños en CSV.")
 
 
-# Función para guardar las consultas en un archivo JSON
+# Función para guardar en JSON las consultas de una sede
+def guardar_consultas_sede(sede, lista):
+    archivo_sede = archivos_sede(sede)[1]
+    datos_consultas = []
+    for mascota in lista:
+        for consulta in mascota.consultas:
+            datos_consultas.append({
+                'nombre_mascota': mascota.nombre,
+                'fecha': consulta.fecha,
+                'motivo': consulta.motivo,
+                'diagnostico': consulta.diagnostico
+            })
+    with open(archivo_sede, mode='w', encoding='utf-8') as archivo:
+        json.dump(datos_consultas, archivo, indent=4)
+    logging.info(f"Sede {sede}: {len(datos_consultas)} consulta(s) guardada(s) en {archivo_sede}")
+
+
+# Función para guardar las consultas de todas las sedes, cada una en su propio archivo JSON
 def guardar_consultas_json():
     try:
-        if not any(m.consultas for m in mascotas):
-            logging.warning("No hay consultas registradas para guardar en el archivo JSON.")
+        pendientes = {sede: lista for sede, lista in sedes_por_guardar(sedes_consultas_modificadas, 1).items()
+                      if any(m.consultas for m in lista)} # Solo se reescriben las sedes con cambios
+        if not pendientes:
+            if not any(m.consultas for lista in sedes.values() for m in lista):
+                logging.warning("No hay consultas registradas para guardar en el archivo JSON.")
+            else:
+                logging.info("No hay cambios en las consultas para guardar en JSON.")
             return
-        datos_consultas = []
-        for mascota in mascotas:
-            for consulta in mascota.consultas:
-                datos_consultas.append({
-                    'nombre_mascota': mascota.nombre,
-                    'fecha': consulta.fecha,
-                    'motivo': consulta.motivo,
-                    'diagnostico': consulta.diagnostico
-                })
-        with open(archivo_json, mode='w', encoding='utf-8') as archivo:
-            json.dump(datos_consultas, archivo, indent=4)
+        for sede, lista in pendientes.items():
+            guardar_consultas_sede(sede, lista)
+            sedes_consultas_modificadas.discard(sede)
         logging.info("Consultas guardadas en JSON exitosamente")
     except Exception as e:
         logging.exception("Error al guardar las consultas en JSON.")
 
 
-# Función para cargar mascotas y dueños desde un archivo CSV
+# Función para cargar desde CSV las mascotas y dueños de una sede
+def cargar_mascotas_sede(sede, lista):
+    archivo_sede = archivos_sede(sede)[0]
+    indice = {m.nombre: m for m in lista} # Índice por nombre de la sede, para detectar duplicados sin recorrer la lista
+    with open(archivo_sede, mode='r', encoding='utf-8') as archivo:
+        reader = csv.DictReader(archivo)
+        for row in reader:
+            if not all(row.values()):
+                logging.warning(f"Fila incompleta en el archivo CSV: {row} . Se omitirá.")
+                continue
+            if row['nombre_mascota'] in indice:
+                logging.warning(f"Ya existe una mascota con el nombre {row['nombre_mascota']} en la sede {sede}. Se omitirá.")
+                continue
+            dueno = Dueno(row['nombre_dueno'], row['telefono'], row['direccion'])
+            mascota = Mascota(row['nombre_mascota'], row['especie'], row['raza'], int(row['edad']), dueno)
+            lista.append(mascota)
+            indice[mascota.nombre] = mascota
+
+
+# Función para cargar las mascotas y dueños de todas las sedes desde sus archivos CSV
 def cargar_mascotas_csv():
     try:
-        if not os.path.exists(archivo_csv):
+        encontradas = sedes_en_disco(archivo_csv, prefijo_csv, '.csv')
+        if not encontradas:
             logging.warning("Archivo CSV de mascotas no encontrado.")
             return
-        with open(archivo_csv, mode='r', encoding='utf-8') as archivo:
-            reader = csv.DictReader(archivo)
-            for row in reader:
-                if not all(row.values()):
-                    logging.warning(f"Fila incompleta en el archivo CSV: {row} . Se omitirá.")
-                    continue
-                if any(m.nombre == row['nombre_mascota'] for m in mascotas):
-                    logging.warning(f"Ya existe una mascota con el nombre {row['nombre_mascota']}. Se omitirá.")
-                    continue
-                dueno = Dueno(row['nombre_dueno'], row['telefono'], row['direccion'])
-                mascota = Mascota(row['nombre_mascota'], row['especie'], row['raza'], int(row['edad']), dueno)
-                mascotas.append(mascota)
+        for sede in encontradas: # Cada sede se carga de forma independiente en su propia lista
+            cargar_mascotas_sede(sede, obtener_sede(sede))
+        sedes_mascotas_modificadas.difference_update(encontradas) # Las sedes cargadas coinciden con sus archivos
         logging.info("Datos de mascotas y dueños cargados desde CSV exitosamente")
     except Exception as e:
         logging.exception("Error al cargar datos desde CSV.")
 
 
-# Función para cargar consultas desde un archivo JSON
+# Función para cargar desde JSON las consultas de una sede
+def cargar_consultas_sede(sede, lista):
+    archivo_sede = archivos_sede(sede)[1]
+    indice = {m.nombre: m for m in lista} # Índice por nombre de la sede, para asociar cada consulta a su mascota
+    with open(archivo_sede, mode='r', encoding='utf-8') as archivo:
+        datos_consultas = json.load(archivo)
+        for item in datos_consultas:
+            mascota = indice.get(item['nombre_mascota'])
+            if mascota:
+                consulta = Consulta(item['fecha'], item['motivo'], item['diagnostico'], mascota)
+                mascota.agregar_consulta(consulta)
+
+
+# Función para cargar las consultas de todas las sedes desde sus archivos JSON
 def cargar_consultas_json():
     try:
-        if not os.path.exists(archivo_json):
+        encontradas = sedes_en_disco(archivo_json, prefijo_json, '.json')
+        if not encontradas:
             logging.warning("Archivo JSON de consultas no encontrado.")
             return
-        with open(archivo_json, mode='r', encoding='utf-8') as archivo:
-            datos_consultas = json.load(archivo)
-            for item in datos_consultas:
-                mascota = next((m for m in mascotas if m.nombre == item['nombre_mascota']), None)
-                if mascota:
-                    consulta = Consulta(item['fecha'], item['motivo'], item['diagnostico'], mascota)
-                    mascota.agregar_consulta(consulta)
+        for sede in [sede for sede in encontradas if sede not in sedes]: # Las consultas solo se cargan en sedes con mascotas cargadas
+            logging.warning(f"El archivo {encontradas.pop(sede)} no corresponde a ninguna sede cargada. Se omitirá.")
+        for sede in encontradas:
+            cargar_consultas_sede(sede, obtener_sede(sede))
+        sedes_consultas_modificadas.difference_update(encontradas)
         logging.info("Consultas cargadas desde JSON exitosamente")
     except Exception as e:
-        logging.exception("Error al cargar consultas desde JSON.")
+        logging.exception("Error al cargar consultas desde JSON.")
\ No newline at end of file
@@ -2,13 +2,79 @@
 
 from datetime import datetime # Importación del módulo datetime para manejar fechas
 import logging # Importación del módulo logging para manejar registros de eventos
+from concurrent.futures import ThreadPoolExecutor # Importación de ThreadPoolExecutor para recorrer las sedes en paralelo
 from modelos import Dueno, Mascota, Consulta # Importación de las clases Dueno, Mascota y Consulta
 
 
-# Lista vacía para almacenar todas las mascotas registradas
+# Nombre de la sede por defecto y número máximo de hilos para recorrer las sedes en paralelo
+SEDE_PRINCIPAL = "principal"
+MAX_HILOS_SEDES = 8
+
+# Lista vacía para almacenar las mascotas registradas en la sede principal
 global mascotas # Se define la variable global mascotas para que pueda ser accedida en otras funciones
 mascotas = []
 
+# Registro particionado por sede: cada sede tiene su propia lista de mascotas, que se carga, guarda e indexa por separado
+sedes = {SEDE_PRINCIPAL: mascotas}
+sede_actual = SEDE_PRINCIPAL
+
+# Sedes con cambios sin guardar: al exportar solo se reescriben los archivos de estas sedes
+sedes_mascotas_modificadas = set()
+sedes_consultas_modificadas = set()
+
+
+# Función que indica si un nombre de sede es válido. El nombre se usa en los nombres de archivo de la sede, por eso
+# debe estar en minúsculas: en sistemas de archivos sin distinción de mayúsculas "Norte" y "norte" compartirían archivos
+def nombre_sede_valido(nombre):
+    return bool(nombre) and nombre == nombre.lower() and nombre.replace("-", "").replace("_", "").isalnum()
+
+
+# Función para obtener la lista de mascotas de una sede, creándola si aún no existe
+def obtener_sede(nombre):
+    return sedes.setdefault(nombre, [])
+
+
+# Función para obtener el nombre de la sede en la que se registran las nuevas mascotas
+def obtener_sede_actual():
+    return sede_actual
+
+
+# Función para vaciar el registro de todas las sedes. La lista de la sede principal se conserva porque otros módulos la importan directamente
+def limpiar_sedes():
+    global sede_actual
+    mascotas.clear()
+    for nombre in list(sedes):
+        if nombre != SEDE_PRINCIPAL:
+            del sedes[nombre]
+    sede_actual = SEDE_PRINCIPAL
+    sedes_mascotas_modificadas.clear()
+    sedes_consultas_modificadas.clear()
+
+
+# Función que aplica "funcion(sede, lista)" a cada sede en paralelo y devuelve los resultados en el orden de las sedes
+def recorrer_sedes(funcion, sedes_objetivo=None):
+    objetivo = dict(sedes if sedes_objetivo is None else sedes_objetivo) # Copia para no depender de cambios en el diccionario durante el recorrido
+    if not objetivo:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(objetivo), MAX_HILOS_SEDES)) as executor:
+        return list(executor.map(funcion, objetivo.keys(), objetivo.values()))
+
+
+# Función que reúne las mascotas de todas las sedes como pares (sede, mascota)
+def todas_las_mascotas():
+    resultados = recorrer_sedes(lambda sede, lista: [(sede, mascota) for mascota in list(lista)])
+    return [par for resultado in resultados for par in resultado]
+
+
+# Función para mostrar una lista numerada de pares (sede, mascota), agrupados bajo el nombre de su sede
+def mostrar_mascotas(registradas):
+    sede_anterior = None
+    for i, (sede, mascota) in enumerate(registradas, 1):
+        if sede != sede_anterior:
+            print(f"[Sede: {sede}]")
+            sede_anterior = sede
+        print(f"{i}. {mascota}")
+
 
 # Función para registrar una nueva mascota y su dueño
 def registrar_mascota():
@@ -43,10 +109,11 @@ def registrar_mascota():
 
         dueno = Dueno(nombre_dueno, telefono, direccion)
         mascota = Mascota(nombre, especie, raza, edad, dueno)
-        mascotas.append(mascota)
+        obtener_sede(sede_actual).append(mascota)
+        sedes_mascotas_modificadas.add(sede_actual)
         print("\n¡Mascota registrada exitosamente!\n")
 
-        logging.info(f"Mascota registrada exitosamente: {mascota.nombre}, Dueño: {dueno.nombre}")
+        logging.info(f"Mascota registrada exitosamente: {mascota.nombre}, Dueño: {dueno.nombre}, Sede: {sede_actual}")
     except ValueError as ve: # Captura de errores de valor
         print(f"Error: {ve}")
         logging.error(f"Error al registrar mascota: {ve}") # Registro del error
@@ -59,18 +126,19 @@ def registrar_mascota():
 def registrar_consulta():
     try:
         print("\n--- Registrar Consulta (0 para volver) ---")
-        if not mascotas:
+        registradas = todas_las_mascotas() # Mascotas de todas las sedes
+        if not registradas:
             print("\nNo hay mascotas registradas.\n")
             return
 
-        for i, mascota in enumerate(mascotas, 1):
-            print(f"{i}. {mascota}")
+        mostrar_mascotas(registradas)
 
         id_input = input("Seleccione el número de la mascota: ")
         if id_input == "0": return
         idmascota = int(id_input) - 1
-        if not (0 <= idmascota < len(mascotas)):
+        if not (0 <= idmascota < len(registradas)):
             raise IndexError("Número de mascota no válido.")
+        sede, mascota = registradas[idmascota]
 
         while True:
             fecha = input("Fecha (YYYY-MM-DD): ")
@@ -87,11 +155,12 @@ def registrar_consulta():
         diagnostico = input("Diagnóstico: ")
         if diagnostico == "0": return
 
-        consulta = Consulta(fecha, motivo, diagnostico, mascotas[idmascota])
-        mascotas[idmascota].agregar_consulta(consulta)
+        consulta = Consulta(fecha, motivo, diagnostico, mascota)
+        mascota.agregar_consulta(consulta)
+        sedes_consultas_modificadas.add(sede)
         print("\n¡Consulta registrada exitosamente!\n")
 
-        logging.info(f"Consulta registrada para {mascotas[idmascota].nombre} en {fecha}")
+        logging.info(f"Consulta registrada para {mascota.nombre} en {fecha}, Sede: {sede}")
     except ValueError: # Captura de errores de valor
         print("Entrada inválida. Por favor ingrese un número válido.")
         logging.error("Valor inválido al seleccionar mascota para realizar consulta.") # Registro del error
@@ -100,4 +169,29 @@ def registrar_consulta():
         logging.warning(f"El número seleccionado está fuera del rango: {ie}") # Registro de la advertencia
     except Exception as e: # Captura de errores imprevistos en tiempo de ejecución
         print("Ocurrió un error al registrar la consulta.")
-        logging.exception("Excepción general al registrar consulta.") # Registro de la excepción general
\ No newline at end of file
+        logging.exception("Excepción general al registrar consulta.") # Registro de la excepción general
+
+
+# Función para cambiar la sede en la que se registran las nuevas mascotas
+def cambiar_sede():
+    global sede_actual
+    try:
+        print("\n--- Cambiar Sede (0 para volver) ---")
+        print(f"Sede actual: {sede_actual}")
+        print(f"Sedes registradas: {', '.join(sedes)}")
+        nombre = input("Nombre de la sede: ").strip().lower() # Los nombres de sede se guardan en minúsculas
+        if nombre == "0": return
+        if not nombre_sede_valido(nombre):
+            raise ValueError("El nombre de la sede solo puede contener letras, números, '-' y '_'.")
+
+        obtener_sede(nombre)
+        sede_actual = nombre
+        print(f"\nSede actual: {sede_actual}\n")
+
+        logging.info(f"Sede actual cambiada a {sede_actual}")
+    except ValueError as ve: # Captura de errores de valor
+        print(f"Error: {ve}")
+        logging.error(f"Error al cambiar de sede: {ve}") # Registro del error
+    except Exception as e: # Captura de errores imprevistos en tiempo de ejecución
+        print("Ocurrió un error al cambiar de sede.")
+        logging.exception("Excepción general al cambiar de sede.") # Registro de la excepción general
\ No newline at end of file
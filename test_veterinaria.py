@@ -11,11 +11,14 @@ from datetime import datetime # Importación del módulo datetime para manejar f
 
 # Importaciones del sistema a probar
 from modelos import Dueno, Mascota, Consulta
-from registro import registrar_mascota, registrar_consulta, mascotas
-from consultas import listar_mascotas, ver_historial_consultas
+from registro import (registrar_mascota, registrar_consulta, mascotas,
+                      sedes, obtener_sede, limpiar_sedes, SEDE_PRINCIPAL,
+                      cambiar_sede, obtener_sede_actual, sedes_mascotas_modificadas,
+                      sedes_consultas_modificadas)
+from consultas import listar_mascotas, ver_historial_consultas, buscar_mascotas
 from persistencia import (guardar_mascotas_csv, guardar_consultas_json,
                          cargar_mascotas_csv, cargar_consultas_json,
-                         archivo_csv, archivo_json)
+                         archivo_csv, archivo_json, archivos_sede)
 
 
 # Clase de pruebas para las clases del módulo modelos.py 
@@ -283,6 +286,242 @@ class TestPersistencia(unittest.TestCase):
         logs = self.log_stream.getvalue()
         self.assertIn("Archivo JSON de consultas no encontrado", logs)
 
+
+# Pruebas unitarias para el registro particionado por sedes
+class TestSedes(unittest.TestCase):
+    
+    # Configuración inicial para las pruebas
+    def setUp(self):
+        limpiar_sedes()
+        
+        # Crear una mascota en la sede principal y otra en la sede "norte"
+        mascotas.append(Mascota("Milo", "Gato", "Persa", 3, Dueno("Laura", "555-3333", "Calle 3")))
+        bella = Mascota("Bella", "Perro", "Golden", 5, Dueno("Pedro", "555-4444", "Calle 4"))
+        bella.agregar_consulta(Consulta("2023-02-01", "Dolor", "Artritis", bella))
+        obtener_sede("norte").append(bella)
+        
+        # Configurar logging para capturar salida
+        self.log_stream = StringIO()
+        logging.basicConfig(stream=self.log_stream, level=logging.INFO)
+        self.eliminar_archivos()
+    
+    # Limpieza después de cada prueba
+    def tearDown(self):
+        limpiar_sedes()
+        logging.getLogger().handlers.clear()
+        self.eliminar_archivos()
+    
+    # Elimina los archivos de prueba de las sedes si existen
+    def eliminar_archivos(self):
+        archivos = [archivo for sede in (SEDE_PRINCIPAL, "norte", "sur") for archivo in archivos_sede(sede)]
+        archivos += ["consultas_copia.seguridad.json", "consultas_backup.json"]
+        for archivo in archivos:
+            if os.path.exists(archivo):
+                os.remove(archivo)
+    
+    # Verifica que cada sede se guarde en sus propios archivos y se cargue de nuevo en su sede
+    def test_guardar_cargar_por_sede(self):
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        csv_norte, json_norte = archivos_sede("norte")
+        self.assertTrue(os.path.exists(csv_norte))
+        self.assertTrue(os.path.exists(json_norte))
+        self.assertFalse(os.path.exists(archivo_json))  # La sede principal no tiene consultas
+        
+        # Verificar que el archivo de la sede principal solo contiene sus mascotas
+        with open(archivo_csv, 'r', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+            self.assertEqual(len(rows), 2)  # Encabezado + 1 mascota
+            self.assertIn("Milo", rows[1])
+        
+        # Limpiar datos y cargar desde los archivos
+        limpiar_sedes()
+        cargar_mascotas_csv()
+        cargar_consultas_json()
+        self.assertEqual([m.nombre for m in mascotas], ["Milo"])
+        self.assertEqual([m.nombre for m in sedes["norte"]], ["Bella"])
+        self.assertEqual(sedes["norte"][0].consultas[0].diagnostico, "Artritis")
+        
+        logs = self.log_stream.getvalue()
+        self.assertIn("Sede principal: 1 mascota(s) guardada(s)", logs)
+        self.assertIn("Sede norte: 1 mascota(s) guardada(s)", logs)
+        self.assertIn("Sede norte: 1 consulta(s) guardada(s)", logs)
+    
+    # Verifica que al exportar solo se reescriban los archivos de las sedes modificadas
+    def test_guardar_solo_sedes_modificadas(self):
+        guardar_mascotas_csv()
+        with open(archivo_csv, 'w', encoding='utf-8') as f:
+            f.write("sin cambios")  # Marca para comprobar que el archivo no se reescribe
+        
+        obtener_sede("norte").append(Mascota("Toby", "Perro", "Beagle", 2, Dueno("Sara", "555-5555", "Calle 5")))
+        sedes_mascotas_modificadas.add("norte")
+        self.log_stream.truncate(0)
+        guardar_mascotas_csv()
+        
+        with open(archivo_csv, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "sin cambios")
+        with open(archivos_sede("norte")[0], 'r', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.reader(f))), 3)  # Encabezado + 2 mascotas
+        self.assertNotIn("norte", sedes_mascotas_modificadas)
+        
+        logs = self.log_stream.getvalue()
+        self.assertIn("Sede norte: 2 mascota(s) guardada(s)", logs)
+        self.assertNotIn("Sede principal", logs)
+    
+    # Verifica la carga de sedes desde disco cuando no existe el archivo de la sede principal
+    def test_cargar_sin_sede_principal(self):
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        os.remove(archivo_csv)
+        with open("consultas_copia.seguridad.json", 'w', encoding='utf-8') as f:
+            json.dump([], f)  # Archivo cuyo nombre no es una sede válida
+        with open("consultas_backup.json", 'w', encoding='utf-8') as f:
+            f.write("")  # Archivo JSON sin archivo CSV de mascotas de la misma sede
+        
+        limpiar_sedes()
+        cargar_mascotas_csv()
+        cargar_consultas_json()
+        self.assertEqual(len(mascotas), 0)
+        self.assertEqual(list(sedes), [SEDE_PRINCIPAL, "norte"])
+        self.assertEqual(sedes["norte"][0].consultas[0].motivo, "Dolor")
+        
+        logs = self.log_stream.getvalue()
+        self.assertIn("El archivo consultas_copia.seguridad.json no corresponde a una sede válida", logs)
+        self.assertIn("El archivo consultas_backup.json no corresponde a ninguna sede cargada", logs)
+        self.assertIn("Consultas cargadas desde JSON exitosamente", logs)
+    
+    # Verifica que el listado reúna las mascotas de todas las sedes
+    @patch('builtins.print')
+    def test_listar_mascotas_varias_sedes(self, mock_print):
+        registradas = listar_mascotas()
+        self.assertEqual([(sede, m.nombre) for sede, m in registradas],
+                         [(SEDE_PRINCIPAL, "Milo"), ("norte", "Bella")])
+        mock_print.assert_any_call("[Sede: norte]")
+    
+    # Verifica que el historial permita seleccionar una mascota de otra sede
+    @patch('builtins.input', return_value='2')
+    @patch('builtins.print')
+    def test_ver_historial_otra_sede(self, mock_print, mock_input):
+        ver_historial_consultas()
+        printed_lines = [str(call.args[0]) for call in mock_print.call_args_list]
+        self.assertIn("Fecha: 2023-02-01, Motivo consulta: Dolor, Diagnóstico: Artritis", printed_lines)
+    
+    # Verifica que la búsqueda encuentre mascotas por nombre del dueño en cualquier sede
+    @patch('builtins.input', return_value='pedro')
+    @patch('builtins.print')
+    def test_buscar_mascotas(self, mock_print, mock_input):
+        buscar_mascotas()
+        printed_lines = [str(call.args[0]) for call in mock_print.call_args_list]
+        self.assertTrue(any(line.startswith("1. Nombre: Bella") for line in printed_lines))
+        self.assertFalse(any("Milo" in line for line in printed_lines))
+    
+    # Verifica que cambiar de sede cree la sede y que las nuevas mascotas se registren en ella
+    @patch('builtins.print')
+    @patch('builtins.input', side_effect=[
+        'sur',  # Nueva sede
+        'Rex', 'Perro', 'Pastor Alemán', '3',  # Datos mascota
+        'María González', '555-9876', 'Av. Siempreviva 742'  # Datos dueño
+    ])
+    def test_cambiar_sede_y_registrar_mascota(self, mock_input, mock_print):
+        cambiar_sede()
+        self.assertEqual(obtener_sede_actual(), "sur")
+        
+        registrar_mascota()
+        self.assertEqual([m.nombre for m in sedes["sur"]], ["Rex"])
+        self.assertEqual([m.nombre for m in mascotas], ["Milo"])
+        self.assertIn("sur", sedes_mascotas_modificadas)
+        
+        logs = self.log_stream.getvalue()
+        self.assertIn("Sede actual cambiada a sur", logs)
+        self.assertIn("Mascota registrada exitosamente: Rex, Dueño: María González, Sede: sur", logs)
+    
+    # Verifica que se rechace un nombre de sede inválido
+    @patch('builtins.print')
+    @patch('builtins.input', return_value='../otra')
+    def test_cambiar_sede_nombre_invalido(self, mock_input, mock_print):
+        cambiar_sede()
+        self.assertEqual(obtener_sede_actual(), SEDE_PRINCIPAL)
+        self.assertNotIn("../otra", sedes)
+        mock_print.assert_any_call("Error: El nombre de la sede solo puede contener letras, números, '-' y '_'.")
+        self.assertIn("Error al cambiar de sede", self.log_stream.getvalue())
+    
+    # Verifica que ingresar "0" cancele el cambio de sede
+    @patch('builtins.print')
+    @patch('builtins.input', return_value='0')
+    def test_cambiar_sede_cancelar(self, mock_input, mock_print):
+        cambiar_sede()
+        self.assertEqual(obtener_sede_actual(), SEDE_PRINCIPAL)
+        self.assertEqual(list(sedes), [SEDE_PRINCIPAL, "norte"])
+    
+    # Verifica que limpiar las sedes devuelva la sede actual a la principal
+    @patch('builtins.print')
+    @patch('builtins.input', return_value='sur')
+    def test_limpiar_sedes_restablece_sede_actual(self, mock_input, mock_print):
+        cambiar_sede()
+        limpiar_sedes()
+        self.assertEqual(obtener_sede_actual(), SEDE_PRINCIPAL)
+        self.assertEqual(list(sedes), [SEDE_PRINCIPAL])
+    
+    # Verifica que se pueda registrar una consulta para una mascota de otra sede usando su número global y que al
+    # exportar solo se reescriba el archivo JSON de esa sede
+    @patch('builtins.print')
+    @patch('builtins.input', side_effect=['2', '2023-03-01', 'Control', 'Saludable'])
+    def test_registrar_consulta_otra_sede(self, mock_input, mock_print):
+        mascotas[0].agregar_consulta(Consulta("2023-01-15", "Vacunación", "Aplicada", mascotas[0]))
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        with open(archivo_json, 'w', encoding='utf-8') as f:
+            f.write("sin cambios")  # Marca para comprobar que el archivo no se reescribe
+        
+        registrar_consulta()
+        self.assertEqual([c.motivo for c in sedes["norte"][0].consultas], ["Dolor", "Control"])
+        self.assertEqual([c.motivo for c in mascotas[0].consultas], ["Vacunación"])
+        self.assertEqual(sedes_consultas_modificadas, {"norte"})
+        self.assertIn("Consulta registrada para Bella en 2023-03-01, Sede: norte", self.log_stream.getvalue())
+        
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        with open(archivo_json, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "sin cambios")
+        with open(archivos_sede("norte")[1], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            self.assertEqual([c['motivo'] for c in data], ["Dolor", "Control"])
+        self.assertEqual(sedes_consultas_modificadas, set())
+        self.assertIn("No hay cambios en las mascotas para guardar en CSV", self.log_stream.getvalue())
+    
+    # Verifica que exportar sin cambios no registre advertencias
+    def test_guardar_sin_cambios(self):
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        self.log_stream.truncate(0)
+        guardar_mascotas_csv()
+        guardar_consultas_json()
+        
+        logs = self.log_stream.getvalue()
+        self.assertIn("No hay cambios en las consultas para guardar en JSON", logs)
+        self.assertNotIn("WARNING", logs)
+    
+    # Verifica que los nombres de sede no distingan mayúsculas, ya que forman parte de los nombres de archivo
+    @patch('builtins.print')
+    @patch('builtins.input', side_effect=['Norte', ' NORTE '])
+    def test_cambiar_sede_sin_distinguir_mayusculas(self, mock_input, mock_print):
+        cambiar_sede()
+        cambiar_sede()
+        self.assertEqual(obtener_sede_actual(), "norte")
+        self.assertEqual(list(sedes), [SEDE_PRINCIPAL, "norte"])
+    
+    # Verifica que se omitan los archivos de sedes con mayúsculas en el nombre
+    def test_cargar_omite_sede_con_mayusculas(self):
+        guardar_mascotas_csv()
+        os.rename(archivos_sede("norte")[0], "mascotas_dueños_Sur.csv")
+        try:
+            limpiar_sedes()
+            cargar_mascotas_csv()
+            self.assertEqual(list(sedes), [SEDE_PRINCIPAL])
+            self.assertIn("El archivo mascotas_dueños_Sur.csv no corresponde a una sede válida", self.log_stream.getvalue())
+        finally:
+            os.remove("mascotas_dueños_Sur.csv")
+
 # Ejecución de las pruebas unitarias
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file